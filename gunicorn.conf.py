@@ -0,0 +1,26 @@
+# Gunicorn configuration for the DevCommunity Flask API
+# Usage: gunicorn -c gunicorn.conf.py app:app
+
+import multiprocessing
+import os
+
+# Listen on all interfaces inside the container
+bind = '0.0.0.0:5000'
+
+# Every endpoint blocks on PostgreSQL or password hashing, so threaded
+# workers keep serving other requests while one is waiting on I/O.
+# Raise GUNICORN_THREADS for more concurrent I/O per worker; keep it at or
+# below DB_POOL_MAX so each thread can always get a database connection.
+# Each worker process holds up to GUNICORN_THREADS connections, so keep
+# workers * threads below PostgreSQL's max_connections (100 by default).
+# cpu_count() sees the host's CPUs inside a container, hence the cap.
+worker_class = 'gthread'
+workers = int(os.environ.get('GUNICORN_WORKERS') or min(multiprocessing.cpu_count() * 2 + 1, 8))
+threads = int(os.environ.get('GUNICORN_THREADS') or 5)
+
+# Import the app once in the master and fork workers from it (copy-on-write)
+preload_app = True
+
+# Log to stdout/stderr so `docker-compose logs` picks it up
+accesslog = '-'
+errorlog = '-'
@@ -16,3 +16,6 @@ CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 
 -- Create index on username for faster lookups
 CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
+
+-- Create index backing the newest-first member listing and its pagination
+CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at DESC, id DESC);
@@ -145,6 +145,58 @@ echo "DELETE /api/users/999"
 curl -s -X DELETE "$BASE_URL/api/users/999" | python -m json.tool 2>/dev/null || curl -s -X DELETE "$BASE_URL/api/users/999"
 echo ""
 
+# Test 15: Duplicate Username (should fail)
+print_header "Test 15: Duplicate Username (Expected: 409)"
+echo "POST /api/users (duplicate username)"
+curl -s -X POST "$BASE_URL/api/users" \
+    -H "Content-Type: application/json" \
+    -d '{"username": "john_doe", "email": "john.other@example.com", "password": "testpass123"}' \
+    | python -m json.tool 2>/dev/null || \
+curl -s -X POST "$BASE_URL/api/users" \
+    -H "Content-Type: application/json" \
+    -d '{"username": "john_doe", "email": "john.other@example.com", "password": "testpass123"}'
+echo ""
+
+# Test 16: Paginated List (first page)
+print_header "Test 16: Paginated List (limit=1)"
+echo "GET /api/users?limit=1"
+curl -s "$BASE_URL/api/users?limit=1" | python -m json.tool 2>/dev/null || curl -s "$BASE_URL/api/users?limit=1"
+echo ""
+
+# Test 17: Paginated List (next page via next_cursor)
+print_header "Test 17: Paginated List (next page)"
+NEXT_CURSOR=$(curl -s "$BASE_URL/api/users?limit=1" \
+    | python -c "import sys, json; print(json.load(sys.stdin)['next_cursor'] or '')" 2>/dev/null)
+echo "GET /api/users?limit=1&cursor=$NEXT_CURSOR"
+curl -s -G "$BASE_URL/api/users" --data-urlencode "limit=1" --data-urlencode "cursor=$NEXT_CURSOR" \
+    | python -m json.tool 2>/dev/null || \
+curl -s -G "$BASE_URL/api/users" --data-urlencode "limit=1" --data-urlencode "cursor=$NEXT_CURSOR"
+echo ""
+
+# Test 18: Invalid limit (should fail)
+print_header "Test 18: Invalid Limit (Expected: 400)"
+echo "GET /api/users?limit=0"
+curl -s "$BASE_URL/api/users?limit=0" | python -m json.tool 2>/dev/null || curl -s "$BASE_URL/api/users?limit=0"
+echo ""
+
+# Test 19: Invalid cursor (should fail)
+print_header "Test 19: Invalid Cursor (Expected: 400)"
+echo "GET /api/users?cursor=bogus"
+curl -s "$BASE_URL/api/users?cursor=bogus" | python -m json.tool 2>/dev/null || curl -s "$BASE_URL/api/users?cursor=bogus"
+echo ""
+
+# Test 20: Conditional GET with the user's ETag
+print_header "Test 20: Conditional Get User (Expected: 304)"
+ETAG=$(curl -s -D - -o /dev/null "$BASE_URL/api/users/1" | grep -i '^etag:' | cut -d' ' -f2- | tr -d '\r')
+echo "GET /api/users/1 (If-None-Match: $ETAG)"
+STATUS=$(curl -s -o /dev/null -w "%{http_code}" -H "If-None-Match: $ETAG" "$BASE_URL/api/users/1")
+if [ "$STATUS" = "304" ]; then
+    echo -e "${GREEN}HTTP $STATUS Not Modified${NC}"
+else
+    echo -e "${RED}HTTP $STATUS (expected 304)${NC}"
+fi
+echo ""
+
 echo "=========================================="
 echo "  All tests completed!"
 echo "=========================================="